@@ -21,6 +21,7 @@ from .core import (
     _replace_dim,
     _resolve_rf,
     _transform,
+    _transform_batch,
 )
 from .estimators import (
     best_fit_rotation,
@@ -57,6 +58,9 @@ __all__ = [
     "transform_points",
     "transform_quaternions",
     "transform_vectors",
+    "transform_points_batch",
+    "transform_quaternions_batch",
+    "transform_vectors_batch",
     "transform_angular_velocity",
     "transform_linear_velocity",
     # coordinate system transforms
@@ -94,12 +98,10 @@ __all__ = [
 ]
 
 _cs_funcs = {
-    "cartesian": {
-        "polar": cartesian_to_polar,
-        "spherical": cartesian_to_spherical,
-    },
-    "polar": {"cartesian": polar_to_cartesian},
-    "spherical": {"cartesian": spherical_to_cartesian},
+    ("cartesian", "polar"): cartesian_to_polar,
+    ("cartesian", "spherical"): cartesian_to_spherical,
+    ("polar", "cartesian"): polar_to_cartesian,
+    ("spherical", "cartesian"): spherical_to_cartesian,
 }
 
 
@@ -328,6 +330,237 @@ def transform_quaternions(
     )
 
 
+def transform_vectors_batch(
+    arrs,
+    into,
+    outof=None,
+    dim=None,
+    axis=None,
+    timestamps=None,
+    time_axis=None,
+    return_timestamps=False,
+):
+    """ Transform multiple arrays of vectors between reference frames.
+
+    The reference frames are only resolved once. If the transformation
+    between them is static and no timestamps are specified, all arrays are
+    transformed in a single step instead of calling `transform_vectors` for
+    each array separately.
+
+    Parameters
+    ----------
+    arrs: iterable of array_like
+        The arrays to transform.
+
+    into: str or ReferenceFrame
+        ReferenceFrame instance or name of a registered reference frame in
+        which the arrays will be represented after the transformation.
+
+    outof: str or ReferenceFrame, optional
+        ReferenceFrame instance or name of a registered reference frame which
+        is the current reference frame of the arrays. Can be omitted if the
+        arrays are DataArrays whose ``attrs`` contain a "representation_frame"
+        entry with the name of a registered frame.
+
+    dim: str, optional
+        If the arrays are DataArrays, the name of the dimension
+        representing the spatial coordinates of the vectors.
+
+    axis: int, optional
+        The axis of the arrays representing the spatial coordinates of the
+        vectors. Defaults to the last axis of the arrays.
+
+    timestamps: array_like or str, optional
+        The timestamps of the vectors, corresponding to the `time_axis`
+        of the arrays. If str and the arrays are DataArrays, the name of the
+        coordinate with the timestamps. Otherwise, the same timestamps are
+        used for all arrays, which must therefore have the same length
+        along the `time_axis`.
+
+    time_axis: int, optional
+        The axis of the arrays representing the timestamps of the vectors.
+        Defaults to the first axis of the arrays.
+
+    return_timestamps: bool, default False
+        If True, also return the timestamps after the transformation.
+
+    Returns
+    -------
+    arrs_transformed: list
+        The transformed arrays or, if `return_timestamps` is True, tuples of
+        the transformed arrays and their timestamps.
+
+    See Also
+    --------
+    transform_vectors, transform_points_batch, transform_quaternions_batch
+    """
+    return _transform_batch(
+        "transform_vectors",
+        arrs,
+        into,
+        outof,
+        dim,
+        axis,
+        timestamps,
+        time_axis,
+        return_timestamps=return_timestamps,
+    )
+
+
+def transform_points_batch(
+    arrs,
+    into,
+    outof=None,
+    dim=None,
+    axis=None,
+    timestamps=None,
+    time_axis=None,
+    return_timestamps=False,
+):
+    """ Transform multiple arrays of points between reference frames.
+
+    The reference frames are only resolved once. If the transformation
+    between them is static and no timestamps are specified, all arrays are
+    transformed in a single step instead of calling `transform_points` for
+    each array separately.
+
+    Parameters
+    ----------
+    arrs: iterable of array_like
+        The arrays to transform.
+
+    into: str or ReferenceFrame
+        ReferenceFrame instance or name of a registered reference frame in
+        which the arrays will be represented after the transformation.
+
+    outof: str or ReferenceFrame, optional
+        ReferenceFrame instance or name of a registered reference frame which
+        is the current reference frame of the arrays. Can be omitted if the
+        arrays are DataArrays whose ``attrs`` contain a "reference_frame"
+        entry with the name of a registered frame.
+
+    dim: str, optional
+        If the arrays are DataArrays, the name of the dimension
+        representing the spatial coordinates of the points.
+
+    axis: int, optional
+        The axis of the arrays representing the spatial coordinates of the
+        points. Defaults to the last axis of the arrays.
+
+    timestamps: array_like or str, optional
+        The timestamps of the points, corresponding to the `time_axis`
+        of the arrays. If str and the arrays are DataArrays, the name of the
+        coordinate with the timestamps. Otherwise, the same timestamps are
+        used for all arrays, which must therefore have the same length
+        along the `time_axis`.
+
+    time_axis: int, optional
+        The axis of the arrays representing the timestamps of the points.
+        Defaults to the first axis of the arrays.
+
+    return_timestamps: bool, default False
+        If True, also return the timestamps after the transformation.
+
+    Returns
+    -------
+    arrs_transformed: list
+        The transformed arrays or, if `return_timestamps` is True, tuples of
+        the transformed arrays and their timestamps.
+
+    See Also
+    --------
+    transform_points, transform_vectors_batch, transform_quaternions_batch
+    """
+    return _transform_batch(
+        "transform_points",
+        arrs,
+        into,
+        outof,
+        dim,
+        axis,
+        timestamps,
+        time_axis,
+        return_timestamps=return_timestamps,
+    )
+
+
+def transform_quaternions_batch(
+    arrs,
+    into,
+    outof=None,
+    dim=None,
+    axis=None,
+    timestamps=None,
+    time_axis=None,
+    return_timestamps=False,
+):
+    """ Transform multiple arrays of quaternions between reference frames.
+
+    The reference frames are only resolved once. If the transformation
+    between them is static and no timestamps are specified, all arrays are
+    transformed in a single step instead of calling `transform_quaternions` for
+    each array separately.
+
+    Parameters
+    ----------
+    arrs: iterable of array_like
+        The arrays to transform.
+
+    into: str or ReferenceFrame
+        ReferenceFrame instance or name of a registered reference frame in
+        which the arrays will be represented after the transformation.
+
+    outof: str or ReferenceFrame, optional
+        ReferenceFrame instance or name of a registered reference frame which
+        is the current reference frame of the arrays. Can be omitted if the
+        arrays are DataArrays whose ``attrs`` contain a "reference_frame"
+        entry with the name of a registered frame.
+
+    dim: str, optional
+        If the arrays are DataArrays, the name of the dimension
+        representing the spatial coordinates of the quaternions.
+
+    axis: int, optional
+        The axis of the arrays representing the spatial coordinates of the
+        quaternions. Defaults to the last axis of the arrays.
+
+    timestamps: array_like or str, optional
+        The timestamps of the quaternions, corresponding to the `time_axis`
+        of the arrays. If str and the arrays are DataArrays, the name of the
+        coordinate with the timestamps. Otherwise, the same timestamps are
+        used for all arrays, which must therefore have the same length
+        along the `time_axis`.
+
+    time_axis: int, optional
+        The axis of the arrays representing the timestamps of the quaternions.
+        Defaults to the first axis of the arrays.
+
+    return_timestamps: bool, default False
+        If True, also return the timestamps after the transformation.
+
+    Returns
+    -------
+    arrs_transformed: list
+        The transformed arrays or, if `return_timestamps` is True, tuples of
+        the transformed arrays and their timestamps.
+
+    See Also
+    --------
+    transform_quaternions, transform_vectors_batch, transform_points_batch
+    """
+    return _transform_batch(
+        "transform_quaternions",
+        arrs,
+        into,
+        outof,
+        dim,
+        axis,
+        timestamps,
+        time_axis,
+        return_timestamps=return_timestamps,
+    )
+
+
 def transform_angular_velocity(
     arr,
     into,
@@ -617,10 +850,14 @@ def transform_coordinates(
         arr, dim, axis, timestamps=False
     )
 
+    coordinate_system = (
+        attrs.get("coordinate_system") if attrs is not None else None
+    )
+
     if outof is None:
-        if attrs is not None and "coordinate_system" in attrs:
+        if coordinate_system is not None:
             # TODO warn if outof(.name) != attrs["coordinate_system"]
-            outof = attrs["coordinate_system"]
+            outof = coordinate_system
         else:
             raise ValueError(
                 "'outof' must be specified unless you provide a DataArray "
@@ -628,13 +865,12 @@ def transform_coordinates(
                 "name of a valid coordinate system"
             )
 
-    try:
-        transform_func = _cs_funcs[outof][into]
-    except KeyError:
+    transform_func = _cs_funcs.get((outof, into))
+    if transform_func is None:
         raise ValueError(f"Unsupported transformation: {outof} to {into}.")
 
-    if attrs is not None and "coordinate_system" in attrs:
-        attrs.update({"coordinate_system": into})
+    if coordinate_system is not None:
+        attrs["coordinate_system"] = into
 
     arr = transform_func(arr, axis=axis)
 
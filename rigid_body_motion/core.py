@@ -8,17 +8,90 @@ from quaternion import (
     as_quat_array,
     as_rotation_vector,
     derivative,
-    quaternion,
     squad,
 )
 from scipy.interpolate import interp1d
 from scipy.signal import butter, filtfilt
 
+try:
+    import xarray as xr
+except ImportError:  # xarray is an optional dependency
+    xr = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+
+    def njit(*args, **kwargs):
+        """ Fallback for the numba decorator that leaves functions as is. """
+        return lambda func: func
+
+
 Frame = namedtuple(
     "Frame", ("translation", "rotation", "timestamps", "discrete", "inverse"),
 )
 Array = namedtuple("Array", ("data", "timestamps"))
 
+# defined here so that _resolve_rf can look up names without an import
+_registry = {}
+
+
+def _qmul(q1, q2):
+    """ Hamilton product of two float arrays of quaternions. """
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+
+    return np.stack(
+        (
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        ),
+        axis=-1,
+    )
+
+
+def _qconj(q):
+    """ Conjugate (i.e. inverse) of a float array of unit quaternions. """
+    return q * np.array([1.0, -1.0, -1.0, -1.0], dtype=q.dtype)
+
+
+def _qrot(q, v):
+    """ Rotate float array of vectors by float array of unit quaternions. """
+    w, r = q[..., :1], q[..., 1:]
+
+    return v + 2 * np.cross(r, np.cross(r, v) + w * v)
+
+
+@njit(cache=True)
+def _compose_static(translations, rotations):
+    """ Compose a chain of static transformations in scalar form. """
+    tx, ty, tz = 0.0, 0.0, 0.0
+    qw, qx, qy, qz = 1.0, 0.0, 0.0, 0.0
+
+    for i in range(rotations.shape[0]):
+        rw, rx, ry = rotations[i, 0], rotations[i, 1], rotations[i, 2]
+        rz = rotations[i, 3]
+        # rotate translation: v + 2 * cross(r, cross(r, v) + w * v)
+        cx = ry * tz - rz * ty + rw * tx
+        cy = rz * tx - rx * tz + rw * ty
+        cz = rx * ty - ry * tx + rw * tz
+        tx, ty, tz = (
+            tx + 2.0 * (ry * cz - rz * cy) + translations[i, 0],
+            ty + 2.0 * (rz * cx - rx * cz) + translations[i, 1],
+            tz + 2.0 * (rx * cy - ry * cx) + translations[i, 2],
+        )
+        # Hamilton product r * q
+        qw, qx, qy, qz = (
+            rw * qw - rx * qx - ry * qy - rz * qz,
+            rw * qx + rx * qw + ry * qz - rz * qy,
+            rw * qy - rx * qz + ry * qw + rz * qx,
+            rw * qz + rx * qy - ry * qx + rz * qw,
+        )
+
+    return np.array([tx, ty, tz]), np.array([qw, qx, qy, qz])
+
 
 class TransformMatcher:
     """ Matcher for timestamps from reference frames and arrays. """
@@ -54,12 +127,12 @@ class TransformMatcher:
                 translation = np.tile(frame.translation, (len(timestamps), 1))
                 rotation = np.tile(frame.rotation, (len(timestamps), 1))
         elif frame.discrete:
-            translation = np.tile(frame.translation[0], (len(timestamps), 1))
-            for t, ts in zip(frame.translation, frame.timestamps):
-                translation[timestamps >= ts, :] = t
-            rotation = np.tile(frame.rotation[0], (len(timestamps), 1))
-            for r, ts in zip(frame.rotation, frame.timestamps):
-                rotation[timestamps >= ts, :] = r
+            # index of the last frame timestamp before each target timestamp,
+            # target timestamps before the first one get the first transform
+            idx = np.searchsorted(frame.timestamps, timestamps, side="right")
+            idx = np.clip(idx - 1, 0, None)
+            translation = frame.translation[idx]
+            rotation = frame.rotation[idx]
         else:
             # TODO method + optional scipy dependency?
             translation = interp1d(
@@ -114,10 +187,18 @@ class TransformMatcher:
             If True, invert the transformation of the reference frame.
         """
         self._check_timestamps(frame.timestamps, frame.translation.shape)
+
+        if inverse and frame.timestamps is None:
+            # use the precomputed inverse of static frames
+            translation, rotation = frame._get_inverse_transform()
+            inverse = False
+        else:
+            translation, rotation = frame.translation, frame.rotation
+
         self.frames.append(
             Frame(
-                frame.translation,
-                frame.rotation,
+                translation,
+                rotation,
                 frame.timestamps,
                 frame.discrete,
                 inverse,
@@ -258,28 +339,55 @@ class TransformMatcher:
         timestamps: array_like, shape (n_timestamps,) or None
             The timestamps for which the transformation is defined.
         """
-        from rigid_body_motion.utils import rotate_vectors
-
         if timestamps is None:
             timestamps = self.get_timestamps(arrays_first)
 
-        translation = np.zeros(3) if timestamps is None else np.zeros((1, 3))
-        rotation = quaternion(1.0, 0.0, 0.0, 0.0)
+        if timestamps is None and all(
+            frame.timestamps is None for frame in self.frames
+        ):
+            # static frames are stored pre-inverted by add_reference_frame
+            translations = np.reshape(
+                [frame.translation for frame in self.frames], (-1, 3)
+            )
+            rotations = np.reshape(
+                [frame.rotation for frame in self.frames], (-1, 4)
+            )
+            # the chain is composed in double precision, but the result has
+            # the precision of the frames
+            dtype = np.result_type(translations, rotations)
+            translation, rotation = _compose_static(
+                translations.astype(np.float64, copy=False),
+                rotations.astype(np.float64, copy=False),
+            )
+            return (
+                translation.astype(dtype, copy=False),
+                rotation.astype(dtype, copy=False),
+                None,
+            )
 
-        for frame in self.frames:
+        if len(self.frames) == 0:
+            return np.zeros((1, 3)), np.array([1.0, 0.0, 0.0, 0.0]), timestamps
+
+        # start from the first transform in the chain instead of the identity
+        translation, rotation = self._transform_from_frame(
+            self.frames[0], timestamps
+        )
+        if self.frames[0].inverse:
+            rotation = _qconj(rotation)
+            translation = -_qrot(rotation, translation)
+
+        # compose the chain directly as float quaternions and translations
+        for frame in self.frames[1:]:
             t, r = self._transform_from_frame(frame, timestamps)
             if frame.inverse:
-                translation = rotate_vectors(
-                    1 / as_quat_array(r), translation - np.array(t)
-                )
-                rotation = 1 / as_quat_array(r) * rotation
+                r = _qconj(r)
+                translation = _qrot(r, translation - t)
             else:
-                translation = rotate_vectors(
-                    as_quat_array(r), translation
-                ) + np.array(t)
-                rotation = as_quat_array(r) * rotation
+                translation = _qrot(r, translation)
+                translation += t
+            rotation = _qmul(r, rotation)
 
-        return translation, as_float_array(rotation), timestamps
+        return translation, rotation, timestamps
 
     def get_arrays(self, timestamps=None, arrays_first=True):
         """ Get re-sampled arrays
@@ -333,17 +441,17 @@ def _resolve_axis(axis, ndim):
 
 def _resolve_rf(rf):
     """ Retrieve frame by name from registry, if applicable. """
-    # TODO test
     # TODO raise error if not ReferenceFrame instance?
-    from rigid_body_motion.reference_frames import ReferenceFrame, _registry
-
-    if isinstance(rf, ReferenceFrame):
-        return rf
-    elif isinstance(rf, str):
+    if isinstance(rf, str):
         try:
             return _registry[rf]
         except KeyError:
             raise ValueError(f"Frame '{rf}' not found in registry.")
+
+    from rigid_body_motion.reference_frames import ReferenceFrame
+
+    if isinstance(rf, ReferenceFrame):
+        return rf
     else:
         raise TypeError(
             f"Expected frame to be str or ReferenceFrame, "
@@ -454,9 +562,17 @@ def _maybe_unpack_dataarray(
     )
 
 
+def _check_xarray():
+    """ Raise an error if xarray is not installed. """
+    if xr is None:
+        raise ModuleNotFoundError(
+            "xarray must be installed to return a DataArray or Dataset"
+        )
+
+
 def _make_dataarray(arr, coords, dims, name, attrs, time_dim, ts_out):
     """ Make DataArray out of transformation results. """
-    import xarray as xr
+    _check_xarray()
 
     if time_dim is None:
         # no timestamps specified
@@ -546,9 +662,12 @@ def _transform(
         else:
             what = "reference_frame"
 
+    # current frame of the array according to its attrs, if any
+    current = attrs.get(what) if attrs is not None else None
+
     if outof is None:
-        if attrs is not None and what in attrs:
-            outof = _resolve_rf(attrs[what])
+        if current is not None:
+            outof = _resolve_rf(current)
         else:
             raise ValueError(
                 f"'outof' must be specified unless you provide a DataArray "
@@ -557,11 +676,11 @@ def _transform(
             )
     else:
         outof = _resolve_rf(outof)
-        if attrs is not None and what in attrs and attrs[what] != outof.name:
+        if current is not None and current != outof.name:
             warnings.warn(
                 f"You are transforming the '{what}' of the array out of "
                 f"{outof.name}, but the current '{what}' the array is "
-                f"{attrs[what]}"
+                f"{current}"
             )
 
     into = _resolve_rf(into)
@@ -573,15 +692,29 @@ def _transform(
         attrs[what] = into.name
         attrs["representation_frame"] = into.name
 
-    arr, ts_out = getattr(outof, method)(
-        arr,
-        into,
-        axis=axis,
-        timestamps=ts_in,
-        time_axis=time_axis,
-        return_timestamps=True,
-        **kwargs,
-    )
+    if outof is into and method in (
+        "transform_vectors",
+        "transform_points",
+        "transform_quaternions",
+    ):
+        # transforming into the same frame leaves the array unchanged
+        n_axis = 4 if method == "transform_quaternions" else 3
+        arr, ts_out = outof._validate_input(
+            arr, axis, n_axis, ts_in, time_axis
+        )
+        if time_axis is not None:
+            arr = np.swapaxes(arr, 0, time_axis)
+        arr = arr.copy()
+    else:
+        arr, ts_out = getattr(outof, method)(
+            arr,
+            into,
+            axis=axis,
+            timestamps=ts_in,
+            time_axis=time_axis,
+            return_timestamps=True,
+            **kwargs,
+        )
 
     if coords is not None:
         return _make_dataarray(
@@ -593,11 +726,98 @@ def _transform(
         return arr
 
 
+def _transform_batch(
+    method,
+    arrs,
+    into,
+    outof,
+    dim,
+    axis,
+    timestamps,
+    time_axis,
+    return_timestamps=False,
+):
+    """ Base batch transform method. """
+    from rigid_body_motion.utils import is_dataarray
+
+    arrs = list(arrs)
+    into = _resolve_rf(into)
+    if outof is not None:
+        outof = _resolve_rf(outof)
+
+    if (
+        outof is not None
+        and outof is not into
+        and timestamps is None
+        and dim is None
+        and not any(is_dataarray(arr) for arr in arrs)
+    ):
+        up, down = outof._walk(into)
+        if all(rf.timestamps is None for rf in up + down):
+            return _transform_batch_static(
+                method, arrs, into, outof, axis, return_timestamps
+            )
+
+    return [
+        _transform(
+            method,
+            arr,
+            into,
+            outof,
+            dim,
+            axis,
+            timestamps,
+            time_axis,
+            return_timestamps=return_timestamps,
+        )
+        for arr in arrs
+    ]
+
+
+def _transform_batch_static(
+    method, arrs, into, outof, axis, return_timestamps
+):
+    """ Transform arrays along a static chain in a single kernel call. """
+    if len(arrs) == 0:
+        return []
+
+    n_axis = 4 if method == "transform_quaternions" else 3
+    axis = axis or -1
+    arrs = [
+        np.swapaxes(
+            outof._validate_input(arr, axis, n_axis, None, None)[0], axis, -1
+        )
+        for arr in arrs
+    ]
+
+    # a static chain doesn't need to be matched with each array, so all
+    # arrays are stacked and transformed at once
+    t, r, _ = outof._lookup_transform(into)
+    stacked = np.concatenate([arr.reshape(-1, n_axis) for arr in arrs])
+    if method == "transform_vectors":
+        stacked = _qrot(r, stacked)
+    elif method == "transform_points":
+        stacked = _qrot(r, stacked) + t
+    else:
+        stacked = _qmul(r, stacked)
+
+    sections = np.cumsum([arr.size // n_axis for arr in arrs])[:-1]
+    arrs_out = []
+    for arr, arr_out in zip(arrs, np.split(stacked, sections)):
+        arr_out = arr_out.reshape(arr.shape).astype(
+            np.result_type(arr, r), copy=False
+        )
+        arr_out = np.swapaxes(arr_out, -1, axis)
+        arrs_out.append((arr_out, None) if return_timestamps else arr_out)
+
+    return arrs_out
+
+
 def _make_transform_or_pose_dataset(
     translation, rotation, frame, timestamps, pose=False
 ):
     """ Create Dataset with translation and rotation. """
-    import xarray as xr
+    _check_xarray()
 
     if pose:
         linear_name = "position"
@@ -656,7 +876,7 @@ def _make_twist_dataset(
     angular, linear, moving_frame, reference, represent_in, timestamps
 ):
     """ Create Dataset with linear and angular velocity. """
-    import xarray as xr
+    _check_xarray()
 
     twist = xr.Dataset(
         {
@@ -695,7 +915,7 @@ def _make_velocity_dataarray(
     velocity, motion_type, moving_frame, reference, represent_in, timestamps
 ):
     """ Create DataArray with linear or angular velocity. """
-    import xarray as xr
+    _check_xarray()
 
     if motion_type not in ("linear", "angular"):
         raise ValueError(
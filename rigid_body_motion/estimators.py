@@ -339,6 +339,30 @@ def best_fit_rotation(v1, v2, dim=None, axis=None):
     return rotation
 
 
+def _best_fit_transform_matrix(v1, v2):
+    """ Best-fit rotation matrix and translation between two arrays. """
+    # translate points to their centroids
+    mean_v1 = np.mean(v1, axis=0)
+    mean_v2 = np.mean(v2, axis=0)
+    v1_centered = v1 - mean_v1
+    v2_centered = v2 - mean_v2
+
+    # rotation matrix
+    H = np.dot(v1_centered.T, v2_centered)
+    U, S, Vt = np.linalg.svd(H)
+    R = np.dot(Vt.T, U.T)
+
+    # special reflection case
+    if np.linalg.det(R) < 0:
+        Vt[2, :] *= -1
+        R = np.dot(Vt.T, U.T)
+
+    # translation
+    translation = mean_v2.T - np.dot(R, mean_v1.T)
+
+    return R, translation
+
+
 def best_fit_transform(v1, v2, dim=None, axis=None):
     """ Least-squares best-fit transform between two arrays of vectors.
 
@@ -380,28 +404,11 @@ def best_fit_transform(v1, v2, dim=None, axis=None):
     """
     v1, v2, was_dataarray = _reshape_vectors(v1, v2, axis, dim)
 
-    # translate points to their centroids
-    mean_v1 = np.mean(v1, axis=0)
-    mean_v2 = np.mean(v2, axis=0)
-    v1_centered = v1 - mean_v1
-    v2_centered = v2 - mean_v2
-
-    # rotation matrix
-    H = np.dot(v1_centered.T, v2_centered)
-    U, S, Vt = np.linalg.svd(H)
-    R = np.dot(Vt.T, U.T)
-
-    # special reflection case
-    if np.linalg.det(R) < 0:
-        Vt[2, :] *= -1
-        R = np.dot(Vt.T, U.T)
+    R, translation = _best_fit_transform_matrix(v1, v2)
 
     # rotation as quaternion
     rotation = as_float_array(from_rotation_matrix(R))
 
-    # translation
-    translation = mean_v2.T - np.dot(R, mean_v1.T)
-
     if was_dataarray:
         translation, rotation = _make_transform_dataarrays(
             translation, rotation
@@ -500,11 +507,12 @@ def iterative_closest_point(
         idx, distances = _nearest_neighbor(v1_new, v2)
 
         # compute the transformation between the current source and nearest
-        # destination points
-        t, r = best_fit_transform(v1_new, v2[idx])
+        # destination points, the rotation is only converted to a quaternion
+        # for the final transformation
+        R, t = _best_fit_transform_matrix(v1_new, v2[idx])
 
         # update the current source
-        v1_new = rotate_vectors(r, v1_new) + t
+        v1_new = np.dot(v1_new, R.T) + t
 
         # check error
         mean_error = np.mean(distances)
@@ -1,17 +1,18 @@
 """"""
 import numpy as np
-from anytree import NodeMixin, RenderTree, Walker
-from quaternion import as_float_array, as_quat_array, from_rotation_matrix
+from anytree import NodeMixin, RenderTree, WalkError
+from quaternion import as_float_array, from_rotation_matrix
 
 from rigid_body_motion.core import (
     TransformMatcher,
     _estimate_angular_velocity,
     _estimate_linear_velocity,
+    _qconj,
+    _qmul,
+    _qrot,
+    _registry,
     _resolve_rf,
 )
-from rigid_body_motion.utils import qinv, rotate_vectors
-
-_registry = {}
 
 
 def _register(rf, update=False):
@@ -29,6 +30,7 @@ def _register(rf, update=False):
             )
     # TODO check if name is a cs transform?
     _registry[rf.name] = rf
+    _clear_caches()
 
 
 def _deregister(name):
@@ -39,6 +41,13 @@ def _deregister(name):
         )
 
     _registry.pop(name)
+    _clear_caches()
+
+
+def _clear_caches():
+    """ Clear cached walks and transformations between reference frames. """
+    ReferenceFrame._walk_cache.clear()
+    ReferenceFrame._transform_cache.clear()
 
 
 def render_tree(root):
@@ -128,11 +137,48 @@ def deregister_frame(name):
 def clear_registry():
     """ Clear the reference frame registry. """
     _registry.clear()
+    _clear_caches()
+
+
+def _read_only(arr):
+    """ Copy of an array that can't be modified in place. """
+    if arr is None:
+        return None
+
+    # cached transformations would silently go stale after in-place edits
+    arr = np.array(arr)
+    arr.flags.writeable = False
+
+    return arr
+
+
+def _rotation_norm(rotation):
+    """ Norm of rotation quaternions, which must not be zero. """
+    norm = np.linalg.norm(rotation, axis=-1, keepdims=True)
+    if np.any(norm == 0):
+        raise ValueError("rotation must have non-zero norm")
+
+    return norm
+
+
+def _as_float_array(arr):
+    """ Convert to a contiguous array, keeping floating point precision. """
+    arr = np.asarray(arr)
+    if np.issubdtype(arr.dtype, np.floating):
+        return np.ascontiguousarray(arr)
+    else:
+        return np.ascontiguousarray(arr, dtype=np.float64)
 
 
 class ReferenceFrame(NodeMixin):
     """ A three-dimensional reference frame. """
 
+    # Walks and static transformations between frames, keyed by the ids of
+    # both frames. The caches are cleared whenever a frame is created,
+    # modified, re-parented or (de-)registered.
+    _walk_cache = {}
+    _transform_cache = {}
+
     def __init__(
         self,
         name=None,
@@ -160,8 +206,8 @@ class ReferenceFrame(NodeMixin):
             applicable if there is no parent frame.
 
         rotation: array_like, optional
-            The rotation of this frame wrt the parent frame. Not
-            applicable if there is no parent frame.
+            The rotation of this frame wrt the parent frame, normalized to
+            a unit quaternion. Not applicable if there is no parent frame.
 
         timestamps: array_like, optional
             The timestamps for translation and rotation of this frame. Not
@@ -181,6 +227,7 @@ class ReferenceFrame(NodeMixin):
 
         # TODO check name requirement
         self.name = name
+        self._ancestors = ()
 
         if parent is not None:
             self.parent = _resolve_rf(parent)
@@ -199,11 +246,6 @@ class ReferenceFrame(NodeMixin):
         else:
             self.discrete = discrete
 
-    def __del__(self):
-        """ Destructor. """
-        if self.name in _registry and _registry[self.name] is self:
-            _deregister(self.name)
-
     def __str__(self):
         """ String representation. """
         return f"<ReferenceFrame '{self.name}'>"
@@ -212,6 +254,74 @@ class ReferenceFrame(NodeMixin):
         """ String representation. """
         return self.__str__()
 
+    def _post_attach(self, parent):
+        """ Method call after attaching to a parent frame. """
+        self._update_ancestors()
+        _clear_caches()
+
+    def _post_detach(self, parent):
+        """ Method call after detaching from a parent frame. """
+        self._update_ancestors()
+        _clear_caches()
+
+    def _update_ancestors(self):
+        """ Update the ancestors of this frame and all its descendants. """
+        if self.parent is None:
+            self._ancestors = ()
+        else:
+            self._ancestors = self.parent._ancestors + (self.parent,)
+
+        for child in self.children:
+            child._update_ancestors()
+
+    @property
+    def translation(self):
+        """ The translation of this frame wrt the parent frame. """
+        return self._translation
+
+    @translation.setter
+    def translation(self, value):
+        self._translation = _read_only(value)
+        self._inverse = None
+        _clear_caches()
+
+    @property
+    def rotation(self):
+        """ The rotation of this frame wrt the parent frame. """
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        if value is not None:
+            # the closed-form rotation and inversion assume unit quaternions,
+            # normalizing also creates the copy stored by this frame
+            value = _as_float_array(value)
+            value = value / _rotation_norm(value)
+            value.flags.writeable = False
+        self._rotation = value
+        self._inverse = None
+        _clear_caches()
+
+    @property
+    def timestamps(self):
+        """ The timestamps for translation and rotation of this frame. """
+        return self._timestamps
+
+    @timestamps.setter
+    def timestamps(self, value):
+        self._timestamps = _read_only(value)
+        _clear_caches()
+
+    @property
+    def discrete(self):
+        """ Whether the transformations of this frame are events. """
+        return self._discrete
+
+    @discrete.setter
+    def discrete(self, value):
+        self._discrete = value
+        _clear_caches()
+
     @staticmethod
     def _init_arrays(translation, rotation, timestamps, inverse):
         """ Initialize translation, rotation and timestamp arrays. """
@@ -225,30 +335,40 @@ class ReferenceFrame(NodeMixin):
             t_shape = (3,)
             r_shape = (4,)
 
+        # floating point arrays keep their precision (e.g. float32 to save
+        # memory for large timestamped frames), anything else is float64
         if translation is not None:
-            translation = np.asarray(translation)
+            translation = _as_float_array(translation)
             if translation.shape != t_shape:
                 raise ValueError(
                     f"Expected translation to be of shape {t_shape}, got "
                     f"{translation.shape}"
                 )
-        else:
-            translation = np.zeros(t_shape)
 
         if rotation is not None:
-            rotation = np.asarray(rotation)
+            rotation = _as_float_array(rotation)
             if rotation.shape != r_shape:
                 raise ValueError(
                     f"Expected rotation to be of shape {r_shape}, got "
                     f"{rotation.shape}"
                 )
+            norm = _rotation_norm(rotation)
         else:
-            rotation = np.zeros(r_shape)
+            rotation = np.zeros(
+                r_shape,
+                dtype=np.float64 if translation is None else translation.dtype,
+            )
             rotation[..., 0] = 1.0
+            norm = 1.0
+
+        if translation is None:
+            translation = np.zeros(t_shape, dtype=rotation.dtype)
 
         if inverse:
-            rotation = qinv(rotation)
-            translation = -rotate_vectors(rotation, translation)
+            # the rotation is normalized by the setter, but rotating the
+            # translation already requires a unit quaternion
+            rotation = _qconj(rotation)
+            translation = -_qrot(rotation / norm, translation)
 
         return translation, rotation, timestamps
 
@@ -311,8 +431,30 @@ class ReferenceFrame(NodeMixin):
     def _walk(self, to_rf):
         """ Walk from this frame to a target frame along the tree. """
         to_rf = _resolve_rf(to_rf)
-        walker = Walker()
-        up, _, down = walker.walk(self, to_rf)
+        key = (id(self), id(to_rf))
+
+        try:
+            return self._walk_cache[key]
+        except KeyError:
+            pass
+
+        path = self._ancestors + (self,)
+        to_path = to_rf._ancestors + (to_rf,)
+        if path[0] is not to_path[0]:
+            raise WalkError(
+                f"{self} and {to_rf} are not part of the same tree."
+            )
+
+        # the paths from the root are identical up to the common ancestor
+        n_common = 0
+        for rf, other_rf in zip(path, to_path):
+            if rf is not other_rf:
+                break
+            n_common += 1
+
+        up, down = tuple(reversed(path[n_common:])), to_path[n_common:]
+        self._walk_cache[key] = (up, down)
+
         return up, down
 
     def _get_matcher(self, to_frame, arrays=None):
@@ -331,6 +473,60 @@ class ReferenceFrame(NodeMixin):
 
         return matcher
 
+    def _get_inverse_transform(self):
+        """ Get the transformation of the parent frame wrt this frame. """
+        # computed only once since it is needed for every walk down the tree
+        if self._inverse is None:
+            rotation = _qconj(self.rotation)
+            self._inverse = (-_qrot(rotation, self.translation), rotation)
+
+        return self._inverse
+
+    def _lookup_transform(self, to_frame):
+        """ Look up the (cached) transformation from this frame to another. """
+        to_frame = _resolve_rf(to_frame)
+        if to_frame is self:
+            return np.zeros(3), np.array([1.0, 0.0, 0.0, 0.0]), None
+
+        key = (id(self), id(to_frame))
+
+        try:
+            return self._transform_cache[key]
+        except KeyError:
+            pass
+
+        transform = self._get_matcher(to_frame).get_transformation()
+        # timestamped transformations can be arbitrarily large, so only
+        # static ones are cached
+        if transform[2] is None:
+            self._transform_cache[key] = transform
+
+        return transform
+
+    def _match_transform(self, to_frame, arr, arr_ts):
+        """ Get the transformation to another frame matched with an array. """
+        up, down = self._walk(to_frame)
+
+        if all(rf.timestamps is None for rf in up + down):
+            # the fused transformation of a static chain is the same for all
+            # samples of the array and can be applied without re-sampling
+            TransformMatcher._check_timestamps(arr_ts, arr.shape)
+            t, r, _ = self._lookup_transform(to_frame)
+            return t, r, arr, arr_ts
+        elif arr_ts is None:
+            # without array timestamps, the transformation is the same as
+            # the one from lookup_transform
+            t, r, ts = self._lookup_transform(to_frame)
+            matcher = TransformMatcher()
+            matcher.add_array(arr)
+        else:
+            matcher = self._get_matcher(to_frame, arrays=[(arr, arr_ts)])
+            t, r, ts = matcher.get_transformation()
+
+        arr, _ = matcher.get_arrays(ts)
+
+        return t, r, arr, ts
+
     @classmethod
     def from_dataset(
         cls,
@@ -570,9 +766,14 @@ class ReferenceFrame(NodeMixin):
         --------
         lookup_transform
         """
-        matcher = self._get_matcher(to_frame)
+        t, r, ts = self._lookup_transform(to_frame)
 
-        return matcher.get_transformation()
+        if ts is None:
+            # copy cached arrays so that they can't be modified from the
+            # outside, timestamped transformations are computed on every call
+            return t.copy(), r.copy(), None
+        else:
+            return t, r, ts
 
     def transform_vectors(
         self,
@@ -619,12 +820,11 @@ class ReferenceFrame(NodeMixin):
             The timestamps after the transformation.
         """
         arr, arr_ts = self._validate_input(arr, axis, 3, timestamps, time_axis)
-        matcher = self._get_matcher(to_frame, arrays=[(arr, arr_ts)])
-        t, r, ts = matcher.get_transformation()
-        arr, _ = matcher.get_arrays(ts)
+        t, r, arr, ts = self._match_transform(to_frame, arr, arr_ts)
 
         r = self._expand_singleton_axes(r, arr.ndim)
-        arr = rotate_vectors(r, arr, axis=axis)
+        arr = np.swapaxes(arr, axis, -1)
+        arr = np.swapaxes(_qrot(r, arr), -1, axis)
 
         # undo time axis swap
         if time_axis is not None:
@@ -680,14 +880,12 @@ class ReferenceFrame(NodeMixin):
             The timestamps after the transformation.
         """
         arr, arr_ts = self._validate_input(arr, axis, 3, timestamps, time_axis)
-        matcher = self._get_matcher(to_frame, arrays=[(arr, arr_ts)])
-        t, r, ts = matcher.get_transformation()
-        arr, _ = matcher.get_arrays(ts)
+        t, r, arr, ts = self._match_transform(to_frame, arr, arr_ts)
 
         t = self._expand_singleton_axes(t, arr.ndim)
         r = self._expand_singleton_axes(r, arr.ndim)
-        arr = rotate_vectors(r, arr, axis=axis)
-        arr = arr + np.array(t)
+        arr = np.swapaxes(arr, axis, -1)
+        arr = np.swapaxes(_qrot(r, arr) + t, -1, axis)
 
         # undo time axis swap
         if time_axis is not None:
@@ -744,14 +942,11 @@ class ReferenceFrame(NodeMixin):
             The timestamps after the transformation.
         """
         arr, arr_ts = self._validate_input(arr, axis, 4, timestamps, time_axis)
-        matcher = self._get_matcher(to_frame, arrays=[(arr, arr_ts)])
-        t, r, ts = matcher.get_transformation()
-        arr, _ = matcher.get_arrays(ts)
+        t, r, arr, ts = self._match_transform(to_frame, arr, arr_ts)
 
         r = self._expand_singleton_axes(r, arr.ndim)
         arr = np.swapaxes(arr, axis, -1)
-        arr = as_quat_array(r) * as_quat_array(arr)
-        arr = np.swapaxes(as_float_array(arr), -1, axis)
+        arr = np.swapaxes(_qmul(r, arr), -1, axis)
 
         # undo time axis swap
         if time_axis is not None:
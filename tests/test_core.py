@@ -2,18 +2,79 @@ import numpy as np
 import pandas as pd
 import pytest
 from numpy import testing as npt
+from quaternion import as_float_array, as_quat_array
+from quaternion import rotate_vectors as quat_rv
 
+import rigid_body_motion as rbm
 from rigid_body_motion.core import (
     TransformMatcher,
+    _compose_static,
     _estimate_angular_velocity,
     _make_dataarray,
     _maybe_unpack_dataarray,
+    _qconj,
+    _qmul,
+    _qrot,
     _replace_dim,
     _resolve_axis,
+    _resolve_rf,
 )
 
 
 class TestCore:
+    def test_qmul(self):
+        """"""
+        q1 = np.random.randn(10, 4)
+        q2 = np.random.randn(10, 4)
+        npt.assert_allclose(
+            _qmul(q1, q2),
+            as_float_array(as_quat_array(q1) * as_quat_array(q2)),
+        )
+
+        # broadcasting
+        npt.assert_allclose(
+            _qmul(q1[0], q2),
+            as_float_array(as_quat_array(q1[0]) * as_quat_array(q2)),
+        )
+
+    def test_qconj(self):
+        """"""
+        q = np.random.randn(10, 4)
+        q /= np.linalg.norm(q, axis=-1, keepdims=True)
+        npt.assert_allclose(_qconj(q), as_float_array(1 / as_quat_array(q)))
+
+    def test_compose_static(self):
+        """"""
+        t = np.random.randn(3, 3)
+        r = np.random.randn(3, 4)
+        r /= np.linalg.norm(r, axis=-1, keepdims=True)
+
+        t_exp, r_exp = np.zeros(3), np.array([1.0, 0.0, 0.0, 0.0])
+        for tt, rr in zip(t, r):
+            t_exp = _qrot(rr, t_exp) + tt
+            r_exp = _qmul(rr, r_exp)
+
+        t_act, r_act = _compose_static(t, r)
+        npt.assert_allclose(t_act, t_exp)
+        npt.assert_allclose(r_act, r_exp)
+
+        # empty chain
+        t_act, r_act = _compose_static(np.zeros((0, 3)), np.zeros((0, 4)))
+        npt.assert_equal(t_act, (0.0, 0.0, 0.0))
+        npt.assert_equal(r_act, (1.0, 0.0, 0.0, 0.0))
+
+    def test_qrot(self):
+        """"""
+        q = np.random.randn(10, 4)
+        q /= np.linalg.norm(q, axis=-1, keepdims=True)
+        v = np.random.randn(10, 3)
+        npt.assert_allclose(
+            _qrot(q, v), quat_rv(as_quat_array(q), v)[range(10), range(10)]
+        )
+
+        # broadcasting
+        npt.assert_allclose(_qrot(q[0], v), quat_rv(as_quat_array(q[0]), v))
+
     def test_resolve_axis(self):
         """"""
         assert _resolve_axis(0, 1) == 0
@@ -26,6 +87,20 @@ class TestCore:
         with pytest.raises(IndexError):
             _resolve_axis((-2, 0), 1)
 
+    def test_resolve_rf(self):
+        """"""
+        rf_world = rbm.ReferenceFrame("world")
+        assert _resolve_rf(rf_world) is rf_world
+
+        rf_world.register()
+        assert _resolve_rf("world") is rf_world
+
+        with pytest.raises(ValueError):
+            _resolve_rf("not_an_rf")
+
+        with pytest.raises(TypeError):
+            _resolve_rf(None)
+
     def test_replace_dim(self):
         """"""
         xr = pytest.importorskip("xarray")
@@ -175,7 +250,7 @@ class TestCore:
         with pytest.raises(ValueError):
             _maybe_unpack_dataarray(da, dim="cartesian_axis", axis=-1)
 
-    def test_make_dataarray(self):
+    def test_make_dataarray(self, monkeypatch):
         """"""
         xr = pytest.importorskip("xarray")
         arr = np.ones((10, 3))
@@ -256,6 +331,13 @@ class TestCore:
             da_out.coords["test_coord"], np.array(["A", "A", "B", "B", "B"])
         )
 
+        # xarray not installed
+        monkeypatch.setattr(rbm.core, "xr", None)
+        with pytest.raises(ModuleNotFoundError):
+            _make_dataarray(
+                arr, {}, ("cartesian_axis",), None, None, None, None
+            )
+
 
 @pytest.fixture()
 def matcher():
@@ -269,6 +351,20 @@ class TestTransformMatcher:
         matcher.add_reference_frame(mock_frame())
         assert len(matcher.frames) == 1
 
+        # static inverse frames are stored inverted
+        matcher.add_reference_frame(
+            mock_frame(t=(1.0, 0.0, 0.0), r=(0.0, 0.0, 0.0, 1.0)), inverse=True
+        )
+        assert not matcher.frames[1].inverse
+        npt.assert_allclose(matcher.frames[1].translation, (1.0, 0.0, 0.0))
+        npt.assert_allclose(matcher.frames[1].rotation, (0.0, 0.0, 0.0, -1.0))
+
+        # timestamped inverse frames are inverted after matching
+        matcher.add_reference_frame(
+            mock_frame(t=np.ones((5, 3)), ts=np.arange(5)), inverse=True
+        )
+        assert matcher.frames[2].inverse
+
     def test_add_array(self, matcher):
         """"""
         matcher.add_array(np.ones((10, 3)))
@@ -367,6 +463,11 @@ class TestTransformMatcher:
 
         t_act, r_act = matcher._transform_from_frame(rf_3, ts)
         npt.assert_equal(t_act, t[[0, 0, 0, 0, 0, 1, 1, 2, 2]])
+        npt.assert_equal(r_act, rf_3.rotation[[0, 0, 0, 0, 0, 1, 1, 2, 2]])
+
+        # target timestamps before the first frame timestamp
+        t_act, r_act = matcher._transform_from_frame(rf_3, np.arange(-1, 2))
+        npt.assert_equal(t_act, t[[0, 0, 0]])
 
     def test_transform_from_frame_datetime(self, matcher, mock_frame):
         """"""
@@ -394,6 +495,32 @@ class TestTransformMatcher:
         t_act, r_act = matcher._transform_from_frame(rf_3, ts)
         npt.assert_allclose(t_act, t[[0, 0, 0, 0, 0, 1, 1, 2, 2]])
 
+    def test_get_transformation(self, mock_frame):
+        """"""
+        t = np.random.rand(5, 3)
+        r = np.random.rand(5, 4)
+        r /= np.linalg.norm(r, axis=1, keepdims=True)
+        rf_1 = mock_frame(t=t, r=r, ts=np.arange(5))
+        rf_2 = mock_frame(t=(1.0, 2.0, 3.0), r=(0.0, 0.0, 0.0, 1.0))
+
+        for inverse in (True, False):
+            matcher = TransformMatcher()
+            matcher.add_reference_frame(rf_1, inverse=inverse)
+            matcher.add_reference_frame(rf_2)
+            t_act, r_act, ts = matcher.get_transformation()
+            npt.assert_equal(ts, np.arange(5))
+
+            # compare against the static path at each timestamp
+            for idx in range(5):
+                static = TransformMatcher()
+                static.add_reference_frame(
+                    mock_frame(t=t[idx], r=r[idx]), inverse=inverse
+                )
+                static.add_reference_frame(rf_2)
+                t_exp, r_exp, _ = static.get_transformation()
+                npt.assert_allclose(t_act[idx], t_exp)
+                npt.assert_allclose(r_act[idx], r_exp)
+
 
 class TestCoreEstimators:
     def test_estimate_angular_velocity(self, left_eye_dataset):
@@ -1,6 +1,10 @@
+import gc
+import weakref
+
 import numpy as np
 import pandas as pd
 import pytest
+from anytree import WalkError
 from numpy import testing as npt
 
 import rigid_body_motion as rbm
@@ -91,10 +95,27 @@ class TestReferenceFrame:
         rf_world = rbm.ReferenceFrame("world")
         _register(rf_world)
         del rf_world
+        gc.collect()
         assert "world" in rbm.registry
         del rbm.registry["world"]
         assert "world" not in rbm.registry
 
+        # deregistered frames are collected without touching the registry
+        rf_world = rbm.ReferenceFrame("world")
+        rf_world.register()
+        rf_other = rbm.ReferenceFrame("other")
+        rf_other.register()
+        rf_world.deregister()
+        ref = weakref.ref(rf_world)
+        del rf_world
+        gc.collect()
+        assert ref() is None
+        assert list(rbm.registry) == ["other"]
+        assert rbm.registry["other"] is rf_other
+
+        # frames don't need a finalizer for any of this
+        assert not hasattr(rbm.ReferenceFrame, "__del__")
+
     def test_str(self):
         """"""
         rf_world = rbm.ReferenceFrame("world")
@@ -110,6 +131,20 @@ class TestReferenceFrame:
         assert isinstance(r, np.ndarray)
         assert ts is None
 
+        # integers
+        t, r, ts = rbm.ReferenceFrame._init_arrays(
+            (1, 1, 1), (1, 0, 0, 0), None, False
+        )
+        assert t.dtype == np.float64
+        assert r.dtype == np.float64
+
+        # single precision
+        t, r, ts = rbm.ReferenceFrame._init_arrays(
+            np.ones(3, dtype=np.float32), None, None, True
+        )
+        assert t.dtype == np.float32
+        assert r.dtype == np.float32
+
         # nothing
         t, r, ts = rbm.ReferenceFrame._init_arrays(None, None, None, False)
         npt.assert_equal(t, (0.0, 0.0, 0.0))
@@ -161,6 +196,58 @@ class TestReferenceFrame:
         rf_world.deregister()
         assert "world" not in rbm.registry
 
+    def test_non_unit_rotation(self):
+        """"""
+        rf_world = rbm.ReferenceFrame("world")
+        rf_child = rbm.ReferenceFrame(
+            "child", rf_world, rotation=(1.0, 0.0, 0.0, 1.0)
+        )
+        npt.assert_allclose(
+            rf_child.rotation, (np.sqrt(0.5), 0.0, 0.0, np.sqrt(0.5))
+        )
+
+        # rotation by 90 degrees around z
+        npt.assert_allclose(
+            rf_child.transform_points((1.0, 0.0, 0.0), rf_world),
+            (0.0, 1.0, 0.0),
+            atol=1e-12,
+        )
+        npt.assert_allclose(
+            rf_world.transform_vectors((0.0, 1.0, 0.0), rf_child),
+            (1.0, 0.0, 0.0),
+            atol=1e-12,
+        )
+        _, r, _ = rf_child.lookup_transform(rf_world)
+        npt.assert_allclose(r, (np.sqrt(0.5), 0.0, 0.0, np.sqrt(0.5)))
+
+        # inverse frame
+        rf_child_inv = rbm.ReferenceFrame(
+            "child_inv", rf_world, rotation=(1.0, 0.0, 0.0, 1.0), inverse=True
+        )
+        npt.assert_allclose(
+            rf_child_inv.transform_points((1.0, 0.0, 0.0), rf_world),
+            (0.0, -1.0, 0.0),
+            atol=1e-12,
+        )
+
+        # setter
+        rf_child.rotation = (2.0, 0.0, 0.0, 0.0)
+        npt.assert_equal(rf_child.rotation, (1.0, 0.0, 0.0, 0.0))
+
+        # zero norm
+        with pytest.raises(ValueError):
+            rbm.ReferenceFrame("zero", rf_world, rotation=(0.0, 0.0, 0.0, 0.0))
+        with pytest.raises(ValueError):
+            rbm.ReferenceFrame(
+                "zero",
+                rf_world,
+                rotation=np.vstack((np.ones(4), np.zeros(4))),
+                timestamps=np.arange(2),
+                inverse=True,
+            )
+        with pytest.raises(ValueError):
+            rf_child.rotation = (0.0, 0.0, 0.0, 0.0)
+
     def test_walk(self):
         """"""
         rf_world = rbm.ReferenceFrame("world")
@@ -170,6 +257,35 @@ class TestReferenceFrame:
         up, down = rf_child._walk(rf_child2)
         assert up == (rf_child,)
         assert down == (rf_child2,)
+        key = (id(rf_child), id(rf_child2))
+        assert rbm.ReferenceFrame._walk_cache[key] == (up, down)
+
+        # re-parenting clears the cache
+        rf_child2.parent = rf_child
+        assert key not in rbm.ReferenceFrame._walk_cache
+        up, down = rf_child._walk(rf_child2)
+        assert up == ()
+        assert down == (rf_child2,)
+
+        # deeper tree
+        rf_grandchild = rbm.ReferenceFrame("grandchild", parent=rf_child2)
+        rf_child3 = rbm.ReferenceFrame("child3", parent=rf_world)
+        up, down = rf_grandchild._walk(rf_child3)
+        assert up == (rf_grandchild, rf_child2, rf_child)
+        assert down == (rf_child3,)
+        up, down = rf_child3._walk(rf_grandchild)
+        assert up == (rf_child3,)
+        assert down == (rf_child, rf_child2, rf_grandchild)
+
+        # re-parenting updates the ancestors of all descendants
+        rf_child2.parent = rf_child3
+        up, down = rf_grandchild._walk(rf_world)
+        assert up == (rf_grandchild, rf_child2, rf_child3)
+        assert down == ()
+
+        # different trees
+        with pytest.raises(WalkError):
+            rf_child._walk(rbm.ReferenceFrame("other_world"))
 
     def test_validate_input(self):
         """"""
@@ -243,7 +359,7 @@ class TestReferenceFrame:
         )
 
         npt.assert_equal(rf_child.translation, np.ones((10, 3)))
-        npt.assert_equal(rf_child.rotation, np.ones((10, 4)))
+        npt.assert_equal(rf_child.rotation, 0.5 * np.ones((10, 4)))
         npt.assert_equal(rf_child.timestamps, np.arange(10))
 
     def test_from_translation_datarray(self):
@@ -273,7 +389,7 @@ class TestReferenceFrame:
             da, "time", rf_world
         )
 
-        npt.assert_equal(rf_child.rotation, np.ones((10, 4)))
+        npt.assert_equal(rf_child.rotation, 0.5 * np.ones((10, 4)))
         npt.assert_equal(rf_child.timestamps, np.arange(10))
 
     def test_from_rotation_matrix(self):
@@ -386,6 +502,79 @@ class TestReferenceFrame:
         npt.assert_equal(r_act, np.tile([[1.0, 0.0, 0.0, 0.0]], (10, 1)))
         npt.assert_allclose(ts, np.arange(10))
 
+    def test_lookup_transform_cache(self, get_rf_tree):
+        """"""
+        rf_world, rf_child1, rf_child2 = get_rf_tree(tc1=(1.0, 0.0, 0.0))
+        key = (id(rf_child1), id(rf_world))
+
+        t_act, _, _ = rf_child1.lookup_transform(rf_world)
+        assert key in rbm.ReferenceFrame._transform_cache
+
+        # modifying the returned arrays doesn't affect the cache
+        t_act[0] = 2.0
+        t_act, _, _ = rf_child1.lookup_transform(rf_world)
+        npt.assert_equal(t_act, (1.0, 0.0, 0.0))
+
+        # modifying the frame clears the cache
+        rf_child1.translation = np.array((0.0, 1.0, 0.0))
+        assert key not in rbm.ReferenceFrame._transform_cache
+        t_act, _, _ = rf_child1.lookup_transform(rf_world)
+        npt.assert_equal(t_act, (0.0, 1.0, 0.0))
+
+        # re-parenting the frame clears the cache
+        rf_child1.parent = rf_child2
+        assert key not in rbm.ReferenceFrame._transform_cache
+        t_act, _, _ = rf_child1.lookup_transform(rf_world)
+        npt.assert_equal(t_act, (0.0, 1.0, 0.0))
+
+        # registering a frame clears the cache
+        rf_child1.lookup_transform(rf_world)
+        rf_world.register()
+        assert key not in rbm.ReferenceFrame._transform_cache
+
+        # frame arrays can't be modified in place behind the cache's back
+        with pytest.raises(ValueError):
+            rf_child1.translation[0] = 5.0
+        with pytest.raises(ValueError):
+            rf_child1.rotation[0] = 0.0
+
+        # the frame doesn't share memory with the array it was created from
+        translation = np.array((1.0, 0.0, 0.0))
+        rf_child3 = rbm.ReferenceFrame("child3", rf_world, translation)
+        translation[0] = 2.0
+        npt.assert_equal(rf_child3.translation, (1.0, 0.0, 0.0))
+
+        # timestamped transformations aren't cached
+        rf_child4 = rbm.ReferenceFrame(
+            "child4", rf_world, timestamps=np.arange(10)
+        )
+        t_act, r_act, ts_act = rf_child4.lookup_transform(rf_world)
+        key = (id(rf_child4), id(rf_world))
+        assert key not in rbm.ReferenceFrame._transform_cache
+
+        # timestamped results don't share memory with the frame
+        t_act[0] = 1.0
+        ts_act[0] = 1
+        npt.assert_equal(rf_child4.lookup_transform(rf_world)[0][0], 0.0)
+        npt.assert_equal(rf_child4.timestamps, np.arange(10))
+
+    def test_match_transform_static(self, get_rf_tree):
+        """"""
+        rf_world, rf_child1, _ = get_rf_tree(tc1=(1.0, 0.0, 0.0))
+        arr = np.zeros((5, 3))
+        ts = np.arange(5) + 0.5
+
+        # static chain applies to timestamped array without re-sampling
+        t, r, arr_out, ts_out = rf_child1._match_transform(rf_world, arr, ts)
+        npt.assert_equal(t, (1.0, 0.0, 0.0))
+        npt.assert_equal(r, (1.0, 0.0, 0.0, 0.0))
+        assert arr_out is arr
+        assert ts_out is ts
+
+        # timestamps are still validated
+        with pytest.raises(ValueError):
+            rf_child1._match_transform(rf_world, arr, ts[::-1])
+
     def test_transform_vectors(self, transform_grid, get_rf_tree):
         """"""
         o, ot, p, pt, rc1, rc2, tc1, tc2 = transform_grid
@@ -433,6 +622,58 @@ class TestReferenceFrame:
         vt = np.tile(pt, (10, 4, 1)) - np.array(v0t[np.newaxis, :, :])
         np.testing.assert_allclose(vt_act, vt, rtol=1.0, atol=1e-15)
 
+    def test_transform_points_axis(self):
+        """"""
+        rf_world = rbm.ReferenceFrame("world")
+        rf_child = rbm.ReferenceFrame(
+            "child",
+            rf_world,
+            translation=(1.0, 2.0, 3.0),
+            rotation=(np.sqrt(0.5), 0.0, 0.0, np.sqrt(0.5)),
+        )
+
+        # square array, translation must be added along the spatial axis
+        arr = np.eye(3)
+        pt_act = rf_child.transform_points(arr, rf_world, axis=0)
+        pt_exp = rf_child.transform_points(arr.T, rf_world).T
+        npt.assert_allclose(pt_act, pt_exp)
+        npt.assert_allclose(pt_act[:, 0], (1.0, 3.0, 3.0))
+
+        # non-square array
+        arr = np.random.rand(3, 5)
+        pt_act = rf_child.transform_points(arr, rf_world, axis=0)
+        assert pt_act.shape == (3, 5)
+        npt.assert_allclose(
+            pt_act, rf_child.transform_points(arr.T, rf_world).T
+        )
+
+    def test_transform_points_float32(self):
+        """"""
+        rf_world = rbm.ReferenceFrame("world")
+        rf_child = rbm.ReferenceFrame(
+            "child", rf_world, translation=np.ones(3, dtype=np.float32)
+        )
+
+        pt_act = rf_child.transform_points(
+            np.zeros((10, 3), dtype=np.float32), rf_world
+        )
+        assert pt_act.dtype == np.float32
+        npt.assert_allclose(pt_act, np.ones((10, 3)))
+
+        # double precision arrays stay double precision
+        pt_act = rf_child.transform_points(np.zeros((10, 3)), rf_world)
+        assert pt_act.dtype == np.float64
+
+        # dtypes that can't be composed in compiled code
+        for dtype in (np.float16, np.longdouble):
+            rf_child = rbm.ReferenceFrame(
+                "child", rf_world, translation=np.ones(3, dtype=dtype)
+            )
+            t, r, _ = rf_child.lookup_transform(rf_world)
+            assert t.dtype == dtype
+            assert r.dtype == dtype
+            npt.assert_allclose(t.astype(float), (1.0, 1.0, 1.0))
+
     def test_transform_points(self, transform_grid, get_rf_tree):
         """"""
         o, ot, p, pt, rc1, rc2, tc1, tc2 = transform_grid
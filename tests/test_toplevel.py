@@ -41,6 +41,102 @@ class TestTopLevel:
         )
         npt.assert_almost_equal(arr_child1, arr_exp)
 
+    def test_transform_identity(self, rf_tree):
+        """"""
+        arr = np.ones((10, 3))
+
+        arr_out, ts_out = rbm.transform_points(
+            arr,
+            into="child1",
+            outof="child1",
+            timestamps=np.arange(10),
+            return_timestamps=True,
+        )
+        npt.assert_equal(arr_out, arr)
+        npt.assert_equal(ts_out, np.arange(10))
+        assert arr_out is not arr
+
+        arr_out = rbm.transform_quaternions(
+            np.ones((10, 4)), into="child1", outof="child1"
+        )
+        npt.assert_equal(arr_out, np.ones((10, 4)))
+
+        # shape is still validated
+        with pytest.raises(ValueError):
+            rbm.transform_vectors(
+                np.ones((10, 4)), into="child1", outof="child1"
+            )
+
+    def test_transform_batch(self, rf_tree):
+        """"""
+        arrs = [np.random.rand(10, 3), np.random.rand(5, 3)]
+
+        for method in ("vectors", "points"):
+            batch_func = getattr(rbm, f"transform_{method}_batch")
+            single_func = getattr(rbm, f"transform_{method}")
+            arrs_out = batch_func(arrs, into="child1", outof="child2")
+            assert len(arrs_out) == 2
+            for arr, arr_out in zip(arrs, arrs_out):
+                npt.assert_allclose(
+                    arr_out, single_func(arr, into="child1", outof="child2")
+                )
+
+        arrs = [np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0]])]
+        arrs_out = rbm.transform_quaternions_batch(
+            arrs, into="child1", outof="child2"
+        )
+        npt.assert_allclose(
+            arrs_out[0],
+            rbm.transform_quaternions(arrs[0], into="child1", outof="child2"),
+        )
+
+        # arrays with different shapes along another axis
+        arrs = [np.random.rand(7, 3, 2), np.random.rand(2, 3)]
+        arrs_out = rbm.transform_points_batch(
+            arrs, into="child1", outof="child2", axis=1
+        )
+        for arr, arr_out in zip(arrs, arrs_out):
+            assert arr_out.shape == arr.shape
+            npt.assert_allclose(
+                arr_out,
+                rbm.transform_points(
+                    arr, into="child1", outof="child2", axis=1
+                ),
+            )
+
+        # timestamps are returned per array
+        arr_out, ts_out = rbm.transform_points_batch(
+            [np.ones(3)], into="child1", outof="child2", return_timestamps=True
+        )[0]
+        assert ts_out is None
+
+        # no arrays
+        assert rbm.transform_points_batch([], "child1", "child2") == []
+
+        # wrong shape
+        with pytest.raises(ValueError):
+            rbm.transform_points_batch(
+                [np.ones((5, 4))], into="child1", outof="child2"
+            )
+
+        # timestamped frame
+        rbm.register_frame("child3", parent="child1", timestamps=np.arange(5))
+        arr = np.random.rand(5, 3)
+        arr_out, ts_out = rbm.transform_points_batch(
+            [arr],
+            into="child2",
+            outof="child3",
+            timestamps=np.arange(5),
+            return_timestamps=True,
+        )[0]
+        npt.assert_allclose(
+            arr_out,
+            rbm.transform_points(
+                arr, into="child2", outof="child3", timestamps=np.arange(5)
+            ),
+        )
+        npt.assert_equal(ts_out, np.arange(5))
+
     def test_transform_points_xr(self, rf_tree):
         """"""
         xr = pytest.importorskip("xarray")
@@ -269,6 +365,10 @@ class TestTopLevel:
             rbm.transform_coordinates(
                 np.ones((10, 2)), into="polar", outof="unsupported"
             )
+        with pytest.raises(ValueError):
+            rbm.transform_coordinates(
+                np.ones((10, 2)), into="spherical", outof="polar"
+            )
 
     def test_transform_coordinates_xr(self):
         """"""